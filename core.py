@@ -0,0 +1,558 @@
+"""
+TRAXOVO Watson Intelligence Platform - Core
+Shared TRAXOVOCore and Flask app factory used by the entry points
+"""
+
+import os
+import atexit
+import shutil
+import contextlib
+import mmap
+import hashlib
+import itertools
+import logging
+import threading
+import time
+import zlib
+import tempfile
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from flask import Flask, Response, render_template, jsonify, request, send_file
+from flask.json.provider import JSONProvider
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Fastest available JSON codec: orjson, then ujson, then the stdlib.
+# _dumps always returns compact UTF-8 bytes; _loads accepts bytes or str.
+# The codecs don't agree byte-for-byte (e.g. orjson writes 1e20, the others
+# 1e+20), so ETags and cache file names are only stable for one codec.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    _loads = orjson.loads
+    _JSON_CODEC = 'orjson'
+else:
+    try:
+        import ujson as _json
+
+        def _dumps(obj):
+            return _json.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+    except ImportError:
+        import json as _json
+
+        def _dumps(obj):
+            return _json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+    _JSON_CODEC = _json.__name__
+
+    def _loads(data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return _json.loads(data)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class FastJSONProvider(JSONProvider):
+    """Flask JSON provider backed by the fastest available codec (orjson first)"""
+
+    def dumps(self, obj, **kwargs):
+        return _dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return _loads(s)
+
+    def response(self, *args, **kwargs):
+        # Keep the encoded bytes as-is instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_dumps(obj), mimetype='application/json')
+
+# GNIS Integration Configuration
+GNIS_BASE_URL = os.getenv('REPLIT_KAIZEN_GNIS_URL', 'https://gnis-replicator.replit.app')
+GNIS_API_KEY = os.getenv('GNIS_API_KEY', 'default_key')
+
+# Status snapshots are reused for this many seconds between rebuilds
+STATUS_TTL = 1.0
+
+# Per-process sequence that keeps goal ids unique when the clock reads the same twice
+_GOAL_SEQ = itertools.count()
+
+# GNIS status results are reused for this many seconds
+GNIS_STATUS_TTL = 30.0
+
+# The first status snapshot waits this long for the background GNIS probe
+GNIS_READY_TIMEOUT = 2.0
+
+# After this many consecutive GNIS failures, report offline without probing
+GNIS_FAILURE_THRESHOLD = 3
+GNIS_RESET_TIMEOUT = 60.0
+
+# Gauge payloads larger than this are streamed instead of kept in memory
+GAUGE_STREAM_THRESHOLD = 1024 * 1024
+GAUGE_STREAM_CHUNK = 64 * 1024
+
+# Compression is paid once at startup, so favour ratio over speed
+GAUGE_GZIP_LEVEL = 6
+GAUGE_BROTLI_QUALITY = 5
+
+# Encoded Gauge payloads are written to disk once so they can be sent with sendfile.
+# By default each TRAXOVOCore uses its own private (0700) temp directory; set
+# GAUGE_CACHE_DIR to a directory the proxy can read (and others can't write)
+# when USE_X_SENDFILE=1.
+GAUGE_CACHE_DIR = os.getenv('GAUGE_CACHE_DIR')
+GAUGE_CACHE_PREFIX = 'traxovo_gauge_'
+GAUGE_CACHE_SUFFIXES = {'identity': '', 'gzip': '.gz', 'br': '.br'}
+
+# Shared GNIS session so relay calls reuse pooled keep-alive connections
+GNIS_SESSION = requests.Session()
+GNIS_SESSION.headers.update({"Authorization": f"Bearer {GNIS_API_KEY}"})
+_gnis_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                            max_retries=Retry(total=2, backoff_factor=0.1))
+GNIS_SESSION.mount('https://', _gnis_adapter)
+GNIS_SESSION.mount('http://', _gnis_adapter)
+
+def read_json_mapped(fd):
+    """Parse a JSON file straight from a read-only memory map of an open descriptor"""
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Empty files and some filesystems can't be mapped; read them instead
+        with os.fdopen(os.dup(fd), 'rb') as f:
+            return _loads(f.read())
+    try:
+        with memoryview(mm) as view:
+            return _loads(view)
+    finally:
+        mm.close()
+
+# Parsed Gauge file shared by every TRAXOVOCore, as ((path, mtime_ns), data)
+_gauge_cache = (None, None)
+_gauge_cache_lock = threading.Lock()
+
+def _load_gauge(path):
+    """Parsed Gauge file, reparsed only when its mtime changes"""
+    global _gauge_cache
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # Key on the descriptor we parse from, so the mtime always matches the bytes
+        key = (path, os.fstat(fd).st_mtime_ns)
+        with _gauge_cache_lock:
+            if _gauge_cache[0] != key:
+                _gauge_cache = (key, read_json_mapped(fd))
+            return _gauge_cache[1]
+    finally:
+        os.close(fd)
+
+class TRAXOVOCore:
+    def __init__(self, version="Omega.2.0-MPA", enable_gnis=True):
+        self.version = version
+        self.enable_gnis = enable_gnis
+        self.status = "OPERATIONAL"
+        self._status_cache = None
+        self._status_cached_at = 0.0
+        self._gnis_lock = threading.Lock()
+        self._gnis_cached = None
+        self._gnis_checked_at = 0.0
+        self._gnis_failures = 0
+        self.apis = {
+            'gauge': None,
+            'gnis': {"status": "probing"},
+            'watson': None,
+            'external': None
+        }
+        # Start the network-bound GNIS probe first so it overlaps the local probes.
+        # It runs on a daemon thread: startup (and shutdown) never wait on it.
+        self.gnis_ready = threading.Event()
+        if enable_gnis:
+            threading.Thread(target=self._probe_gnis, name="gnis-probe", daemon=True).start()
+        else:
+            self.apis['gnis'] = {"status": "disabled"}
+            self.gnis_ready.set()
+        probes = [self.load_gauge_data, self.initialize_watson_api, self.discover_external_apis]
+        with ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="traxovo-probe") as pool:
+            gauge, watson, external = pool.map(lambda probe: probe(), probes)
+        self.apis.update(gauge=gauge, watson=watson, external=external)
+        # Gauge data is loaded once and never mutated, so encode it once
+        self._gauge_response, self._gauge_etag, self._gauge_encoded = self._encode_gauge()
+        try:
+            self._gauge_files = self._write_gauge_cache()
+        except OSError as e:
+            logger.warning("Gauge cache files unavailable, serving from memory: %s", e)
+            self._gauge_files = {}
+        
+    def iter_gauge_json(self):
+        """Yield the Gauge payload as JSON in GAUGE_STREAM_CHUNK sized pieces"""
+        gauge = self.apis['gauge']
+        records = gauge['data']
+        # 'data' is the last key, so the envelope splits cleanly around the list
+        head = {key: value for key, value in gauge.items() if key != 'data'}
+        buffer = bytearray(_dumps(head)[:-1] + b',"data":[')
+        for index, record in enumerate(records):
+            if index:
+                buffer += b','
+            buffer += _dumps(record)
+            if len(buffer) >= GAUGE_STREAM_CHUNK:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b']}'
+        yield bytes(buffer)
+
+    def _encode_gauge(self):
+        """Encode the Gauge payload once, returning (body or None, etag, compressed bodies)"""
+        digest = hashlib.blake2b(digest_size=8)
+        compressors = {}
+        if brotli is not None:
+            compressors['br'] = brotli.Compressor(quality=GAUGE_BROTLI_QUALITY)
+        compressors['gzip'] = zlib.compressobj(GAUGE_GZIP_LEVEL, zlib.DEFLATED, 31)
+        encoded = {name: [] for name in compressors}
+        size = 0
+        parts = []
+        for chunk in self.iter_gauge_json():
+            digest.update(chunk)
+            size += len(chunk)
+            encoded['gzip'].append(compressors['gzip'].compress(chunk))
+            if 'br' in compressors:
+                encoded['br'].append(compressors['br'].process(chunk))
+            if parts is not None:
+                parts.append(chunk)
+                if size > GAUGE_STREAM_THRESHOLD:
+                    # Too large to pin in memory; the view streams it instead
+                    parts = None
+        encoded['gzip'].append(compressors['gzip'].flush())
+        if 'br' in compressors:
+            encoded['br'].append(compressors['br'].finish())
+        body = b''.join(parts) if parts is not None else None
+        return body, digest.hexdigest(), {name: b''.join(out) for name, out in encoded.items()}
+
+    def _write_gauge_cache(self):
+        """Write each encoded Gauge representation to the cache directory, keyed by ETag"""
+        if GAUGE_CACHE_DIR:
+            cache_dir = GAUGE_CACHE_DIR
+            os.makedirs(cache_dir, exist_ok=True)
+        else:
+            cache_dir = tempfile.mkdtemp(prefix=GAUGE_CACHE_PREFIX)
+            atexit.register(shutil.rmtree, cache_dir, ignore_errors=True)
+        # send_file resolves relative paths against app.root_path, not the cwd
+        cache_dir = os.path.abspath(cache_dir)
+        # Include the codec so workers encoding with different codecs never share files
+        name_prefix = f"{GAUGE_CACHE_PREFIX}{_JSON_CODEC}_"
+        base = os.path.join(cache_dir, f"{name_prefix}{self._gauge_etag}.json")
+        paths = {}
+        for encoding in ('identity', *self._gauge_encoded):
+            path = base + GAUGE_CACHE_SUFFIXES[encoding]
+            if encoding != 'identity':
+                chunks = [self._gauge_encoded[encoding]]
+            elif self._gauge_response is not None:
+                chunks = [self._gauge_response]
+            else:
+                chunks = self.iter_gauge_json()
+            # Always write and replace; a file already sitting at the path is never trusted
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.' + GAUGE_CACHE_PREFIX)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+                # mkstemp creates 0600; X-Sendfile proxies often run as another user
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            paths[encoding] = path
+        # Drop representations left behind by earlier versions of the data
+        current = {os.path.basename(path) for path in paths.values()}
+        for name in os.listdir(cache_dir):
+            if name.startswith(name_prefix) and name not in current:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(os.path.join(cache_dir, name))
+        return paths
+
+    def load_gauge_data(self):
+        """Load and process Gauge API data"""
+        gauge_file = "GAUGE API PULL 1045AM_05.15.2025.json"
+        data = []
+        status = "disconnected"
+        try:
+            data = _load_gauge(gauge_file)
+            status = "connected"
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.exception("❌ Gauge API Error: %s", e)
+        # Always hand out a list so callers never need to type-check the records
+        if not isinstance(data, list):
+            logger.warning("Gauge data is not a list of records; ignoring it")
+            data = []
+        self.gauge_count = len(data)
+        if status == "connected":
+            logger.info("✅ Gauge API: %d records", self.gauge_count)
+        return {"status": status, "records": self.gauge_count, "data": data}
+    
+    def _probe_gnis(self):
+        """Background GNIS discovery"""
+        try:
+            self.apis['gnis'] = self.test_gnis_connection()
+        finally:
+            self.gnis_ready.set()
+
+    def test_gnis_connection(self):
+        """Test GNIS relay connection, cached and behind a circuit breaker"""
+        now = time.monotonic()
+        cached = self._gnis_cached
+        breaker_open = self._gnis_failures >= GNIS_FAILURE_THRESHOLD
+        ttl = GNIS_RESET_TIMEOUT if breaker_open else GNIS_STATUS_TTL
+        if cached is not None and now - self._gnis_checked_at < ttl:
+            return cached
+        # Only one caller probes at a time; everyone else gets the last known status
+        if not self._gnis_lock.acquire(blocking=False):
+            return cached or {"status": "offline", "fallback": "local-mode"}
+        try:
+            result = self._request_gnis_status()
+            if result["status"] == "connected":
+                self._gnis_failures = 0
+            else:
+                self._gnis_failures += 1
+            self._gnis_cached = result
+            self._gnis_checked_at = time.monotonic()
+            return result
+        finally:
+            self._gnis_lock.release()
+
+    def _request_gnis_status(self):
+        """Single GNIS status round-trip"""
+        try:
+            response = GNIS_SESSION.get(f"{GNIS_BASE_URL}/api/kaizen/status", timeout=5)
+            if response.status_code == 200:
+                return {"status": "connected", "endpoint": GNIS_BASE_URL}
+            else:
+                return {"status": "error", "code": response.status_code}
+        except Exception as e:
+            logger.warning("GNIS connection failed: %s", e)
+            return {"status": "offline", "fallback": "local-mode"}
+    
+    def initialize_watson_api(self):
+        """Initialize Watson AI services"""
+        watson_key = os.getenv('WATSON_API_KEY')
+        if watson_key:
+            return {"status": "configured", "services": ["nlp", "vision", "speech"]}
+        return {"status": "requires_config", "services": []}
+    
+    def discover_external_apis(self):
+        """Discover and catalog external API integrations"""
+        apis = []
+        
+        # Check for common API configurations
+        if os.getenv('OPENAI_API_KEY'):
+            apis.append({"name": "OpenAI", "status": "configured"})
+        if os.getenv('ANTHROPIC_API_KEY'):
+            apis.append({"name": "Anthropic", "status": "configured"})
+        if os.getenv('GOOGLE_API_KEY'):
+            apis.append({"name": "Google", "status": "configured"})
+            
+        return {"count": len(apis), "apis": apis}
+    
+    def get_system_status(self):
+        """System status snapshot, rebuilt at most once per STATUS_TTL"""
+        return self._status_snapshot()[0]
+
+    def get_system_status_json(self):
+        """Encoded system status snapshot, cached alongside the dict for STATUS_TTL"""
+        return self._status_snapshot()[1]
+
+    def _status_snapshot(self):
+        if self._status_cache is None:
+            # Give the startup GNIS probe a moment so the first report is real
+            self.gnis_ready.wait(GNIS_READY_TIMEOUT)
+        now = time.monotonic()
+        if self._status_cache is None or now - self._status_cached_at >= STATUS_TTL:
+            snapshot = {
+                "platform": "TRAXOVO Watson Intelligence",
+                "version": self.version,
+                "status": self.status,
+                "timestamp": datetime.now().isoformat(),
+                "apis": self.apis
+            }
+            # The snapshot embeds every Gauge record, so encode it once per rebuild
+            self._status_cache = (snapshot, _dumps(snapshot))
+            self._status_cached_at = now
+        return self._status_cache
+
+    def create_gpt_action(self, action_data):
+        """Create new GPT model action via GNIS"""
+        try:
+            raw_body = _dumps(action_data)
+        except Exception as e:
+            logger.error("GNIS action creation failed: %s", e)
+            return {"status": "failed", "error": str(e)}
+        return self._post_gpt_action(raw_body)
+
+    def create_gpt_action_raw(self, raw_body, extra_headers=None):
+        """Create new GPT model action via GNIS from an already-encoded JSON body
+
+        Raises ValueError if raw_body is not exactly one complete JSON value.
+        """
+        # The body is spliced into the envelope verbatim, so it must be checked
+        # first; otherwise a crafted body could close the object and forge keys
+        _loads(raw_body)
+        return self._post_gpt_action(raw_body, extra_headers)
+
+    def _post_gpt_action(self, raw_body, extra_headers=None):
+        """Wrap a validated JSON body in the GNIS envelope and send it"""
+        if not self.enable_gnis:
+            return {"status": "failed", "error": "GNIS integration is disabled"}
+        try:
+            goal_id = f"gpt_action_{time.time_ns():x}_{next(_GOAL_SEQ)}"
+            envelope = {
+                "event_type": "assistant_create_action",
+                "goal_id": goal_id,
+                "metadata": {
+                    "platform": "TRAXOVO",
+                    "version": self.version,
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+            # Splice the caller's JSON in as metadata.action_data (the last key of
+            # the last object) so the body is forwarded without a decode/encode
+            payload = (_dumps(envelope)[:-2] + b',"action_data":'
+                       + raw_body.strip() + b'}}')
+
+            headers = {"Content-Type": "application/json"}
+            if extra_headers:
+                headers.update(extra_headers)
+            response = GNIS_SESSION.post(
+                f"{GNIS_BASE_URL}/api/kaizen/sync",
+                data=payload,
+                headers=headers,
+                timeout=10
+            )
+            
+            if response.status_code == 200:
+                return {"status": "success", "goal_id": goal_id, "response": _loads(response.content)}
+            else:
+                return {"status": "error", "code": response.status_code, "message": response.text}
+                
+        except Exception as e:
+            logger.error("GNIS action creation failed: %s", e)
+            return {"status": "failed", "error": str(e)}
+
+def create_app(version, enable_gnis=False):
+    """Build a configured TRAXOVO Flask app"""
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+    # Behind Apache/lighttpd, let the proxy send cached files via X-Sendfile
+    app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE') == '1'
+
+    traxovo = TRAXOVOCore(version, enable_gnis=enable_gnis)
+    app.extensions['traxovo'] = traxovo
+
+    @app.route('/')
+    def dashboard():
+        """Main Dashboard - Modern MPA Landing"""
+        return render_template('dashboard.html', 
+                             system_status=traxovo.apis,
+                             version=traxovo.version)
+
+    @app.route('/apis')
+    def api_management():
+        """API Management Interface"""
+        return render_template('api_management.html', 
+                             apis=traxovo.apis,
+                             external_count=traxovo.apis['external']['count'])
+
+    @app.route('/gpt-actions')
+    def gpt_actions():
+        """GPT Model Actions Interface"""
+        return render_template('gpt_actions.html')
+
+    @app.route('/data-processing')
+    def data_processing():
+        """Data Processing Interface"""
+        gauge_data = traxovo.apis['gauge']['data']
+        return render_template('data_processing.html', 
+                             gauge_data=gauge_data,
+                             record_count=traxovo.apis['gauge']['records'])
+
+    @app.route('/integrations')
+    def integrations():
+        """External Integrations Management"""
+        return render_template('integrations.html', 
+                             integrations=traxovo.apis['external']['apis'])
+
+    # API Endpoints
+    @app.route('/api/system/status')
+    def api_system_status():
+        """System status API"""
+        return app.response_class(traxovo.get_system_status_json(), mimetype='application/json')
+
+    @app.route('/api/gpt/create-action', methods=['POST'])
+    def api_create_gpt_action():
+        """Create new GPT model action"""
+        try:
+            action_data = request.get_json()
+            result = traxovo.create_gpt_action(action_data)
+            return jsonify(result)
+        except Exception as e:
+            return jsonify({"status": "error", "message": str(e)}), 500
+
+    @app.route('/api/gauge/data')
+    def api_gauge_data():
+        """Gauge API data endpoint"""
+        encoding = request.accept_encodings.best_match(tuple(traxovo._gauge_encoded))
+        etag = traxovo._gauge_etag if encoding is None else f"{traxovo._gauge_etag}-{encoding}"
+        headers = {'ETag': f'"{etag}"', 'Cache-Control': 'public, max-age=60', 'Vary': 'Accept-Encoding'}
+        if etag in request.if_none_match:
+            return Response(status=304, headers=headers)
+        path = traxovo._gauge_files.get(encoding or 'identity')
+        if path is not None:
+            try:
+                # send_file hands the open file to wsgi.file_wrapper (sendfile under gunicorn)
+                response = send_file(path, mimetype='application/json', etag=etag, max_age=60)
+            except FileNotFoundError:
+                logger.warning("Gauge cache file %s disappeared, serving from memory", path)
+            else:
+                response.headers.pop('Content-Disposition', None)
+                response.vary.add('Accept-Encoding')
+                if encoding is not None:
+                    response.content_encoding = encoding
+                return response
+        if encoding is not None:
+            headers['Content-Encoding'] = encoding
+            body = traxovo._gauge_encoded[encoding]
+        else:
+            body = traxovo._gauge_response
+            if body is None:
+                body = traxovo.iter_gauge_json()
+        return Response(body, mimetype='application/json', headers=headers)
+
+    @app.route('/api/gnis/sync', methods=['POST'])
+    def api_gnis_sync():
+        """GNIS synchronization endpoint"""
+        try:
+            if not request.is_json:
+                return jsonify({"status": "error", "message": "Expected an application/json body"}), 415
+            # Forward the raw body to GNIS without re-encoding it
+            try:
+                result = traxovo.create_gpt_action_raw(request.get_data(cache=False))
+            except ValueError:
+                return jsonify({"status": "error", "message": "Request body is not valid JSON"}), 400
+            return jsonify(result)
+        except Exception as e:
+            return jsonify({"status": "error", "message": str(e)}), 500
+
+    return app
@@ -6,193 +6,21 @@ Omega Singularity Integration with Full API Stack
 """
 
 import os
-import sys
-import json
-import logging
-import requests
-from datetime import datetime
-from flask import Flask, render_template, jsonify, request, redirect, url_for
-from werkzeug.utils import secure_filename
+from core import GNIS_BASE_URL, create_app, logger
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-app = Flask(__name__)
-app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-
-# GNIS Integration Configuration
-GNIS_BASE_URL = os.getenv('REPLIT_KAIZEN_GNIS_URL', 'https://gnis-replicator.replit.app')
-GNIS_API_KEY = os.getenv('GNIS_API_KEY', 'default_key')
-
-class TRAXOVOCore:
-    def __init__(self):
-        self.version = "Omega.2.0-MPA"
-        self.status = "OPERATIONAL"
-        self.apis = {
-            'gauge': self.load_gauge_data(),
-            'gnis': self.test_gnis_connection(),
-            'watson': self.initialize_watson_api(),
-            'external': self.discover_external_apis()
-        }
-        
-    def load_gauge_data(self):
-        """Load and process Gauge API data"""
-        gauge_file = "GAUGE API PULL 1045AM_05.15.2025.json"
-        if os.path.exists(gauge_file):
-            try:
-                with open(gauge_file, 'r') as f:
-                    data = json.load(f)
-                logger.info(f"✅ Gauge API: {len(data) if isinstance(data, list) else 'Unknown'} records")
-                return {"status": "connected", "records": len(data) if isinstance(data, list) else 0, "data": data}
-            except Exception as e:
-                logger.error(f"❌ Gauge API Error: {e}")
-        return {"status": "disconnected", "records": 0, "data": {}}
-    
-    def test_gnis_connection(self):
-        """Test GNIS relay connection"""
-        try:
-            response = requests.get(f"{GNIS_BASE_URL}/api/kaizen/status", timeout=5)
-            if response.status_code == 200:
-                return {"status": "connected", "endpoint": GNIS_BASE_URL}
-            else:
-                return {"status": "error", "code": response.status_code}
-        except Exception as e:
-            logger.warning(f"GNIS connection failed: {e}")
-            return {"status": "offline", "fallback": "local-mode"}
-    
-    def initialize_watson_api(self):
-        """Initialize Watson AI services"""
-        watson_key = os.getenv('WATSON_API_KEY')
-        if watson_key:
-            return {"status": "configured", "services": ["nlp", "vision", "speech"]}
-        return {"status": "requires_config", "services": []}
-    
-    def discover_external_apis(self):
-        """Discover and catalog external API integrations"""
-        apis = []
-        
-        # Check for common API configurations
-        if os.getenv('OPENAI_API_KEY'):
-            apis.append({"name": "OpenAI", "status": "configured"})
-        if os.getenv('ANTHROPIC_API_KEY'):
-            apis.append({"name": "Anthropic", "status": "configured"})
-        if os.getenv('GOOGLE_API_KEY'):
-            apis.append({"name": "Google", "status": "configured"})
-            
-        return {"count": len(apis), "apis": apis}
-    
-    def create_gpt_action(self, action_data):
-        """Create new GPT model action via GNIS"""
-        try:
-            payload = {
-                "event_type": "assistant_create_action",
-                "goal_id": f"gpt_action_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                "metadata": {
-                    "platform": "TRAXOVO",
-                    "version": self.version,
-                    "action_data": action_data,
-                    "timestamp": datetime.now().isoformat()
-                }
-            }
-            
-            response = requests.post(
-                f"{GNIS_BASE_URL}/api/kaizen/sync",
-                json=payload,
-                headers={"Authorization": f"Bearer {GNIS_API_KEY}"},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                return {"status": "success", "goal_id": payload["goal_id"], "response": response.json()}
-            else:
-                return {"status": "error", "code": response.status_code, "message": response.text}
-                
-        except Exception as e:
-            logger.error(f"GNIS action creation failed: {e}")
-            return {"status": "failed", "error": str(e)}
-
-# Initialize TRAXOVO Core
-traxovo = TRAXOVOCore()
-
-@app.route('/')
-def dashboard():
-    """Main Dashboard - Modern MPA Landing"""
-    return render_template('dashboard.html', 
-                         system_status=traxovo.apis,
-                         version=traxovo.version)
-
-@app.route('/apis')
-def api_management():
-    """API Management Interface"""
-    return render_template('api_management.html', 
-                         apis=traxovo.apis,
-                         external_count=traxovo.apis['external']['count'])
-
-@app.route('/gpt-actions')
-def gpt_actions():
-    """GPT Model Actions Interface"""
-    return render_template('gpt_actions.html')
-
-@app.route('/data-processing')
-def data_processing():
-    """Data Processing Interface"""
-    gauge_data = traxovo.apis['gauge']['data']
-    return render_template('data_processing.html', 
-                         gauge_data=gauge_data,
-                         record_count=traxovo.apis['gauge']['records'])
-
-@app.route('/integrations')
-def integrations():
-    """External Integrations Management"""
-    return render_template('integrations.html', 
-                         integrations=traxovo.apis['external']['apis'])
-
-# API Endpoints
-@app.route('/api/system/status')
-def api_system_status():
-    """System status API"""
-    return jsonify({
-        "platform": "TRAXOVO Watson Intelligence",
-        "version": traxovo.version,
-        "status": traxovo.status,
-        "timestamp": datetime.now().isoformat(),
-        "apis": traxovo.apis
-    })
-
-@app.route('/api/gpt/create-action', methods=['POST'])
-def api_create_gpt_action():
-    """Create new GPT model action"""
-    try:
-        action_data = request.get_json()
-        result = traxovo.create_gpt_action(action_data)
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
-
-@app.route('/api/gauge/data')
-def api_gauge_data():
-    """Gauge API data endpoint"""
-    return jsonify(traxovo.apis['gauge'])
-
-@app.route('/api/gnis/sync', methods=['POST'])
-def api_gnis_sync():
-    """GNIS synchronization endpoint"""
-    try:
-        sync_data = request.get_json()
-        # Forward to GNIS with local processing
-        result = traxovo.create_gpt_action(sync_data)
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"status": "error", "message": str(e)}), 500
+app = create_app('Omega.2.0-MPA', enable_gnis=True)
+traxovo = app.extensions['traxovo']
 
+# Production runs go through gunicorn (see .replit):
+#   gunicorn --bind 0.0.0.0:5000 --worker-class gthread --threads 4 main:app
+# Running this file directly starts Werkzeug's development server.
 if __name__ == '__main__':
     logger.info("🧠 TRAXOVO Watson Intelligence Platform - Modern MPA Starting...")
-    logger.info(f"🚀 Version: {traxovo.version}")
-    logger.info(f"🌐 GNIS Endpoint: {GNIS_BASE_URL}")
+    logger.info("🚀 Version: %s", traxovo.version)
+    logger.info("🌐 GNIS Endpoint: %s", GNIS_BASE_URL)
     
     # Create templates directory if it doesn't exist
     os.makedirs('templates', exist_ok=True)
     
-    # Run on all interfaces, port 5000
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Run on all interfaces, port 5000; debugger and reloader only in development
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv('FLASK_ENV') == 'development')